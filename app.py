@@ -168,6 +168,53 @@ def tide_info():
         return "json_data"
 
 
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+    'arrow': 'application/vnd.apache.arrow.stream'
+}
+
+
+@app.route('/data/export')
+def data_export():
+    """Stream station data in bulk.
+
+    The endpoint accepts query parameters:
+    * stationName or stationReference (comma separated, optional)
+    * t_from
+    * t_to
+    * format (csv, ndjson or arrow)
+    * compression (gzip)
+    """
+    stationName = request.args.get('stationName', default=None, type=str)
+    stationReference = request.args.get('stationReference', default=None, type=str)
+    t_from = request.args.get('t_from', default=None, type=str)
+    t_to = request.args.get('t_to', default=None, type=str)
+    fmt = request.args.get('format', default='csv', type=str)
+    compression = request.args.get('compression', default=None, type=str)
+    if fmt not in EXPORT_MIMETYPES:
+        return f"The format must be one of csv, ndjson or arrow!"
+    if compression not in (None, 'gzip'):
+        return f"The compression can only be gzip!"
+    if stationName is not None and stationReference is not None:
+        return f"You can only input the station name or the station reference!"
+    station_names = None
+    if stationName is not None:
+        station_names = [name.replace(" ", "+") for name in stationName.split(",")]
+        if not all(is_in_stations_name(name) for name in station_names):
+            return f'The station you input is wrong!'
+    elif stationReference is not None:
+        references = stationReference.split(",")
+        if not all(is_in_stations_ref(reference) for reference in references):
+            return f'The station you input is wrong!'
+        station_names = [stations_reader.get_name(reference) for reference in references]
+    chunks = tide_reader.export_data(station_names, t_from, t_to, fmt=fmt, compression=compression)
+    headers = {'Content-Disposition': f'attachment; filename=tides.{fmt}'}
+    if compression == 'gzip':
+        headers['Content-Encoding'] = 'gzip'
+    return Response(chunks, mimetype=EXPORT_MIMETYPES[fmt], headers=headers)
+
+
 @app.route('/data/html', methods=['GET', 'POST'])
 def data_html():
     stationName = request.args.get('stationName', default=None, type=str)
@@ -1,5 +1,9 @@
 """ Module containing a class to process tidal data."""
 
+import io
+import zlib
+
+import numpy as np
 import pandas as pd
 import matplotlib
 
@@ -15,6 +19,8 @@ class Reader:
         The underlying tide data.
     """
 
+    EXPORT_FORMATS = ('csv', 'ndjson', 'arrow')
+
     def __init__(self, filename):
         """Read in the rainfall data from a named ``.csv``
            file using ``pandas``.
@@ -276,6 +282,110 @@ class Reader:
         else:
             return True
 
+    def export_data(self, station_name=None, time_from=None, time_to=None,
+                    fmt='csv', compression=None, chunksize=10000):
+        """Stream the tide data in chunks of encoded bytes.
+
+        Rows are selected by station and time range, have noise removed
+        and are encoded one chunk at a time, so the full result is never
+        held in memory.
+
+        Parameters
+        ----------
+
+        station_name: str, list of strs or None
+            Station Name(s) to export. If ``None``, then all stations used.
+        time_from: str or None
+            Time from which to report (ISO 8601 format)
+            If ``None``, then earliest value used.
+        time_to: str or None
+            Time up to which to report (ISO 8601 format)
+            If ``None``, then latest value used.
+        fmt: str
+            One of ``csv``, ``ndjson`` or ``arrow`` (Arrow IPC stream).
+        compression: str or None
+            ``gzip`` to compress the output, or ``None``.
+        chunksize: int
+            Number of rows encoded per chunk.
+
+        Returns
+        -------
+
+        generator of bytes
+            The encoded (and optionally compressed) data.
+
+        Examples
+        --------
+
+        # >>> reader = Reader("tideReadings.csv")
+        # >>> next(reader.export_data("Newlyn")).splitlines()[0]
+        b'dateTime,stationName,tideValue'
+        """
+        if fmt not in self.EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        if compression not in (None, 'gzip'):
+            raise ValueError(f"Unknown compression: {compression}")
+        if chunksize < 1:
+            raise ValueError("chunksize must be positive")
+        if isinstance(station_name, str):
+            station_name = [station_name]
+        # Hold on to the current frame so that concurrent add_data calls
+        # do not change the rows being exported
+        data = self.data
+        mask = np.ones(len(data), dtype=bool)
+        if station_name is not None:
+            mask &= data.stationName.isin(station_name).to_numpy()
+        if time_from is not None:
+            mask &= (data.dateTime >= time_from).to_numpy()
+        if time_to is not None:
+            mask &= (data.dateTime <= time_to).to_numpy()
+        rows = np.flatnonzero(mask)
+        encoded = self._encode_chunks(data, rows, fmt, chunksize)
+        if compression == 'gzip':
+            return self._gzip_chunks(encoded)
+        return encoded
+
+    @staticmethod
+    def _encode_chunks(data, rows, fmt, chunksize):
+        writer = sink = None
+        if fmt == 'arrow':
+            import pyarrow as pa
+            schema = pa.schema([('dateTime', pa.string()), ('stationName', pa.string()),
+                                ('tideValue', pa.float64())])
+            sink = io.BytesIO()
+            writer = pa.ipc.new_stream(sink, schema)
+        elif fmt == 'csv':
+            yield b'dateTime,stationName,tideValue\n'
+        for start in range(0, len(rows), chunksize):
+            chunk = data.iloc[rows[start:start + chunksize]][['dateTime', 'stationName', 'tideValue']]
+            # Remove the noise
+            chunk = chunk.assign(tideValue=pd.to_numeric(chunk['tideValue'], errors='coerce'))
+            chunk = chunk[chunk['tideValue'].notnull()]
+            if chunk.empty:
+                continue
+            if fmt == 'csv':
+                yield chunk.to_csv(index=False, header=False).encode('utf-8')
+            elif fmt == 'ndjson':
+                lines = chunk.to_json(orient='records', lines=True)
+                yield (lines.rstrip('\n') + '\n').encode('utf-8')
+            else:
+                writer.write_batch(pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=False))
+                yield sink.getvalue()
+                sink.seek(0)
+                sink.truncate(0)
+        if writer is not None:
+            writer.close()
+            yield sink.getvalue()
+
+    @staticmethod
+    def _gzip_chunks(chunks):
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
 
 if __name__ == "__main__":
     reader = Reader("tideReadings.csv")